@@ -0,0 +1,35 @@
+"""
+Сборка pricing.price в нативный модуль pricing_kernel заранее.
+
+    python build_kernel.py
+
+Рядом появляется pricing_kernel.*.so, который kernel.py подхватывает при
+импорте вместо JIT-компиляции. Без него используется numba.njit (или
+интерпретатор, если numba не установлена).
+
+Опции компиляции совпадают с JIT в kernel.py: cc.export компилирует с
+настройками numba по умолчанию (без fastmath), и kernel.py вызывает njit
+тоже без fastmath. Если меняете одно, меняйте и другое, иначе цены на
+границах копеек будут зависеть от того, собран ли pricing_kernel
+(test_calculator.py это проверяет).
+
+numba.pycc с numba 0.57 помечен как pending deprecation
+(NumbaPendingDeprecationWarning при импорте, по умолчанию скрыт), замены
+пока нет. Если модуль исчезнет из numba, сборку можно заменить на
+mypyc (см. pricing.py) или просто не собирать: kernel.py откатится на JIT.
+"""
+import os
+
+from numba.pycc import CC
+
+import pricing
+
+cc = CC("pricing_kernel")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+# Default compile options, no fastmath: keep in sync with njit in kernel.py
+cc.export("price", pricing.KERNEL_SIGNATURE)(pricing.price)
+
+
+if __name__ == "__main__":
+    cc.compile()
@@ -0,0 +1,149 @@
+"""
+Расчет розничной цены смартфона без интерфейса Streamlit.
+
+Здесь проверка ввода, перевод модели и памяти в коэффициенты, скидка на
+материалы по объему и два входа: скалярный calculate_retail_book_price (через ядро из
+kernel.py) и векторный calculate_retail_book_price_batch на NumPy. Оба
+дают одинаковые до бита цены.
+"""
+import bisect
+import math
+from types import MappingProxyType
+
+import numpy as np
+
+from kernel import price as _kernel
+from pricing import (
+    AMORTIZATION_COST_BASE,
+    LABOR_COST_BASE,
+    MARKUP_FACTOR,
+    MATERIALS_COST_BASE,
+    MAX_KOPEKS,
+)
+
+
+# ===== MODEL AND MEMORY COEFFICIENTS =====
+
+FORMAT_COEF = MappingProxyType({
+    "iPhone 15": 1.0,
+    "iPhone 15 Plus": 1.08,
+    "iPhone 15 Pro": 1.25,
+    "iPhone 15 Pro Max": 1.4
+})
+
+MEM_COEF = MappingProxyType({
+    "128 Gb": 1.0,
+    "256 Gb": 1.12,
+    "512 Gb": 1.28,
+    "1 Tb": 1.45
+})
+
+# ===== SCALE COSTS =====
+# quantity < 100: no discount, 100+: 10%, 500+: 15%, 1000+: 20%
+
+_DISCOUNT_THRESHOLDS = (100, 500, 1000)
+_DISCOUNT_FACTORS = (1.0, 0.9, 0.85, 0.8)
+
+
+# ===== INPUT VALIDATION =====
+
+# (условие ошибки, сообщение); проверяются по порядку, выводится первое
+_VALIDATORS = (
+    (lambda q, v, d: q <= 0, "❌ Количество копий должно быть больше 0"),
+    (lambda q, v, d: not 0 <= v < math.inf, "❌ НДС должен быть неотрицательным числом"),
+    (lambda q, v, d: not 0 <= d <= 100, "❌ Скидка должна быть от 0 до 100%"),
+)
+
+
+def validate_inputs(quantity, vat_percent, discount_percent):
+    """
+    Проверка введенных значений перед расчетом.
+
+    Returns:
+        Сообщение об ошибке для первого нарушенного правила или None
+    """
+    return next(
+        (
+            message for check, message in _VALIDATORS
+            if check(quantity, vat_percent, discount_percent)
+        ),
+        None
+    )
+
+
+def _resolve_factors(format_code, format_code1):
+    # Unknown codes raise KeyError; the selectboxes only offer valid ones
+    return FORMAT_COEF[format_code], MEM_COEF[format_code1]
+
+
+def calculate_retail_book_price(
+    quantity,        # print run (units
+    format_code,     # "A4", "A5", "A6"
+    vat_percent,     # VAT (%)
+    discount_percent,
+    format_code1
+):
+    format_factor, pages_factor = _resolve_factors(format_code, format_code1)
+
+    materials_discount = _DISCOUNT_FACTORS[
+        bisect.bisect_right(_DISCOUNT_THRESHOLDS, quantity)
+    ]
+
+    price_kopeks = _kernel(
+        format_factor,
+        pages_factor,
+        vat_percent,
+        discount_percent,
+        materials_discount
+    )
+
+    return price_kopeks / 100
+
+
+def calculate_retail_book_price_batch(
+    quantity,
+    format_code,
+    vat_percent,
+    discount_percent,
+    format_code1
+):
+    """
+    Векторный вариант calculate_retail_book_price для анализа чувствительности.
+
+    quantity, vat_percent и discount_percent могут быть числами или массивами
+    NumPy; массивы согласуются по правилам broadcasting.
+
+    Returns:
+        Массив розничных цен, округленных до копеек
+
+    Raises:
+        OverflowError: если хотя бы одна цена вне диапазона pricing.price
+        (nan, inf или больше MAX_KOPEKS копеек), как и в скалярном расчете
+    """
+    format_factor, pages_factor = _resolve_factors(format_code, format_code1)
+
+    materials_discount = np.asarray(_DISCOUNT_FACTORS)[
+        np.searchsorted(_DISCOUNT_THRESHOLDS, quantity, side="right")
+    ]
+
+    base_cost = (
+        MATERIALS_COST_BASE * format_factor * pages_factor * materials_discount +
+        LABOR_COST_BASE +
+        AMORTIZATION_COST_BASE
+    )
+
+    final_price = (
+        base_cost *
+        MARKUP_FACTOR *
+        (1 + np.asarray(vat_percent) / 100) *
+        (1 - np.asarray(discount_percent) / 100)
+    )
+
+    # Same half-up rounding and range check as pricing.price, in the same
+    # order of operations, so results match the scalar path bit for bit
+    kopeks = final_price * 100 + 0.5
+
+    if not np.all((0 <= kopeks) & (kopeks < MAX_KOPEKS)):
+        raise OverflowError("price is out of range")
+
+    return np.floor(kopeks) / 100
@@ -0,0 +1,39 @@
+"""
+Выбор реализации pricing.price, которой пользуется приложение.
+
+Порядок: заранее собранный pricing_kernel (build_kernel.py), затем
+pricing, собранный mypyc, затем numba.njit над pricing.price и, если
+numba не установлена, интерпретатор.
+
+Выбор и JIT-компиляция выполняются здесь, а не в main.py:
+Streamlit заново выполняет main.py на каждое действие пользователя, а
+импортированный модуль загружается один раз на процесс.
+"""
+import inspect
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional: fall back to the interpreter
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+import pricing
+
+try:
+    # Ahead-of-time build of pricing.price, see build_kernel.py
+    from pricing_kernel import price
+except ImportError:
+    price = pricing.price
+    # A mypyc build of pricing is already native and cannot be jitted
+    if inspect.isfunction(price):
+        # No fastmath: reassociation would make rounded prices depend on the
+        # backend. build_kernel.py compiles with the same default options.
+        # numba's disk cache does not key on compile flags, only on the
+        # source file of pricing.price: after changing the options here,
+        # touch pricing.py (or delete __pycache__/pricing.price-*.nb[ic])
+        # so stale entries are not reused.
+        # With an explicit signature njit compiles (or loads from cache) right
+        # here, once, and converts int arguments instead of specializing
+        price = njit(pricing.KERNEL_SIGNATURE, cache=True)(price)
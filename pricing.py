@@ -0,0 +1,102 @@
+"""
+Ценовое ядро калькулятора: только арифметика над числами.
+
+Модуль не зависит от Streamlit и numba, поэтому price можно скомпилировать
+заранее (build_kernel.py) или под JIT в kernel.py.
+
+Точность. Формула price сведена к одной сумме трех положительных слагаемых
+(материалы, труд, амортизация) и десятку умножений и делений. Отношение
+наибольшего слагаемого к наименьшему не превышает ~15, взаимного
+уничтожения нет, поэтому math.fsum здесь не нужен: для double
+(IEEE 754, u = 2**-53) относительная ошибка цены без скидки порядка 20u,
+то есть ~1e-15.
+Множитель 1 - discount / 100 при скидке, близкой к 100%, теряет
+относительную точность (ошибка растет как u * d / (100 - d), при
+d = 99.99 уже ~1e-12), но его абсолютная ошибка остается порядка u.
+Поэтому абсолютная ошибка итоговой цены при любой допустимой скидке
+порядка u * цена без скидки: ~1e-11 ₽ для цен ~1e5 ₽ и меньше 1e-9 ₽
+даже при ~1e6 ₽. Это на порядки ниже шага округления до копеек;
+результат может отличаться только на точных половинах копейки.
+Не заменяйте сумму на math.fsum и не разворачивайте формулу обратно в
+цепочку промежуточных величин: точнее не станет, а медленнее будет.
+
+Все параметры и константы аннотированы, так что модуль можно собрать mypyc
+вместо numba:
+
+    mypyc pricing.py
+
+Собранный pricing.*.so импортируется вместо pricing.py; kernel.py в этом
+случае не оборачивает price в njit.
+"""
+from typing import Final
+
+
+# ===== BASE REFERENCE MODEL =====
+# iPhone 15, 128 Gb, 100 units
+
+BASE_QUANTITY: Final = 100
+
+# Native signature of price for numba, shared by kernel.py and build_kernel.py
+KERNEL_SIGNATURE: Final = "i8(f8, f8, f8, f8, f8)"
+
+# Exclusive upper bound on kopeks: values below 2**63 fit the int64 returned
+# by compiled builds
+MAX_KOPEKS: Final = 2.0 ** 63
+
+# ===== FIXED RUSSIAN MARKET COSTS (BASE MODEL) =====
+
+MATERIALS_COST_BASE: Final = 2100000
+LABOR_COST_BASE: Final = 1200000
+AMORTIZATION_COST_BASE: Final = 300000
+
+OVERHEAD_PROD_PERCENT: Final = 20
+OVERHEAD_ADMIN_PERCENT: Final = 15
+
+PUBLISHER_MARGIN_PERCENT: Final = 20
+RETAILER_MARKUP_PERCENT: Final = 1
+
+# Overheads, margin and markup are all proportional to the base cost, so
+# the whole chain collapses into one constant per unit of base cost:
+# (1 + overheads) * (1 + margin) * (1 + markup) / base quantity.
+# Quantity cancels out; it only matters through the materials discount.
+
+MARKUP_FACTOR: Final = (
+    (1 + (OVERHEAD_PROD_PERCENT + OVERHEAD_ADMIN_PERCENT) / 100) *
+    (1 + PUBLISHER_MARGIN_PERCENT / 100) *
+    (1 + RETAILER_MARKUP_PERCENT / 100) /
+    BASE_QUANTITY
+)
+
+
+def price(
+    format_factor: float,
+    pages_factor: float,
+    vat_percent: float,
+    discount_percent: float,
+    materials_discount: float
+) -> int:
+    # Pure float arithmetic only: string lookups stay in the Python wrapper.
+    # Evaluated strictly in source order (no fastmath in any backend), so
+    # every build rounds to the same kopek as the NumPy batch path.
+    # Returns the price in whole kopeks, rounded half-up (prices are positive).
+
+    base_cost: float = (
+        MATERIALS_COST_BASE * format_factor * pages_factor * materials_discount +
+        LABOR_COST_BASE +
+        AMORTIZATION_COST_BASE
+    )
+
+    final_price: float = (
+        base_cost *
+        MARKUP_FACTOR *
+        (1 + vat_percent / 100) *
+        (1 - discount_percent / 100)
+    )
+
+    kopeks: float = final_price * 100 + 0.5
+
+    # Also rejects nan: every comparison with it is false
+    if not 0 <= kopeks < MAX_KOPEKS:
+        raise OverflowError("price is out of range")
+
+    return int(kopeks)
@@ -0,0 +1,139 @@
+import bisect
+import importlib.util
+import math
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+import kernel
+from calculator import (
+    _DISCOUNT_FACTORS,
+    _DISCOUNT_THRESHOLDS,
+    FORMAT_COEF,
+    MEM_COEF,
+    calculate_retail_book_price,
+    calculate_retail_book_price_batch,
+    validate_inputs,
+)
+
+QUANTITIES = np.array([1, 99, 100, 101, 499, 500, 501, 999, 1000, 1001, 5000])
+VAT_PERCENTS = (0.0, 10.0, 18.0, 20.0, 20.5)
+DISCOUNT_PERCENTS = (0.0, 5.0, 12.5, 33.3, 99.9, 100.0)
+
+# Prices from the original step-by-step chain (overheads, full cost, margin,
+# VAT, markup, discount), chosen away from half-kopek ties
+BASELINE_PRICES = [
+    ((1, "iPhone 15", 20.0, 0.0, "128 Gb"), 70683.84),
+    ((100, "iPhone 15 Plus", 20.0, 0.0, "256 Gb"), 74338.67),
+    ((250, "iPhone 15 Pro", 18.0, 5.0, "512 Gb"), 82978.31),
+    ((500, "iPhone 15 Pro Max", 20.0, 10.0, "1 Tb"), 90538.05),
+    ((750, "iPhone 15", 10.0, 12.5, "1 Tb"), 64383.5),
+    ((1000, "iPhone 15 Plus", 0.0, 0.0, "128 Gb"), 54230.21),
+    ((3000, "iPhone 15 Pro Max", 20.0, 33.0, "256 Gb"), 54386.13),
+    ((50, "iPhone 15 Pro", 20.5, 7.5, "1 Tb"), 96772.7),
+    ((2000, "iPhone 15 Pro", 20.0, 50.0, "512 Gb"), 41114.43),
+]
+
+
+def _load_pricing_source():
+    # Always the interpreted pricing.py, even when a mypyc build shadows it
+    path = Path(__file__).with_name("pricing.py")
+    spec = importlib.util.spec_from_file_location("_pricing_source", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.mark.parametrize("quantity, vat_percent, discount_percent, expected", [
+    (100, 20.0, 0.0, None),
+    (1, 0.0, 100.0, None),
+    (0, 20.0, 0.0, "❌ Количество копий должно быть больше 0"),
+    (100, -1.0, 0.0, "❌ НДС должен быть неотрицательным числом"),
+    (100, math.inf, 0.0, "❌ НДС должен быть неотрицательным числом"),
+    (100, math.nan, 0.0, "❌ НДС должен быть неотрицательным числом"),
+    (100, 20.0, -0.1, "❌ Скидка должна быть от 0 до 100%"),
+    (100, 20.0, 100.1, "❌ Скидка должна быть от 0 до 100%"),
+    (100, 20.0, math.nan, "❌ Скидка должна быть от 0 до 100%"),
+])
+def test_validate_inputs(quantity, vat_percent, discount_percent, expected):
+    assert validate_inputs(quantity, vat_percent, discount_percent) == expected
+
+
+@pytest.mark.parametrize("quantity, expected", [
+    (99, 1.0),
+    (100, 0.9),
+    (499, 0.9),   # no discount in the original ladder ('< 499')
+    (500, 0.85),
+    (999, 0.85),  # no discount in the original ladder ('< 999')
+    (1000, 0.8),
+])
+def test_materials_discount_tiers(quantity, expected):
+    assert _DISCOUNT_FACTORS[bisect.bisect_right(_DISCOUNT_THRESHOLDS, quantity)] == expected
+
+
+@pytest.mark.parametrize("args, expected", BASELINE_PRICES)
+def test_fused_formula_matches_baseline_chain(args, expected):
+    quantity, format_code, vat_percent, discount_percent, format_code1 = args
+    assert calculate_retail_book_price(
+        quantity, format_code, vat_percent, discount_percent, format_code1
+    ) == expected
+
+
+@pytest.mark.parametrize("format_code", list(FORMAT_COEF))
+@pytest.mark.parametrize("format_code1", list(MEM_COEF))
+def test_batch_matches_scalar(format_code, format_code1):
+    for vat_percent in VAT_PERCENTS:
+        for discount_percent in DISCOUNT_PERCENTS:
+            batch = calculate_retail_book_price_batch(
+                QUANTITIES, format_code, vat_percent, discount_percent, format_code1
+            )
+            scalar = [
+                calculate_retail_book_price(
+                    int(quantity), format_code, vat_percent, discount_percent, format_code1
+                )
+                for quantity in QUANTITIES
+            ]
+            assert batch.tolist() == scalar
+
+
+def test_batch_broadcasts_discount_sweep():
+    discounts = np.arange(0, 51)
+    batch = calculate_retail_book_price_batch(100, "iPhone 15", 20.0, discounts, "128 Gb")
+    assert batch.tolist() == [
+        calculate_retail_book_price(100, "iPhone 15", 20.0, float(d), "128 Gb")
+        for d in discounts
+    ]
+
+
+@pytest.mark.parametrize("vat_percent", [float("nan"), float("inf"), 1e300])
+def test_out_of_range_price_raises(vat_percent):
+    with pytest.raises(OverflowError):
+        calculate_retail_book_price(100, "iPhone 15", vat_percent, 0.0, "128 Gb")
+
+
+@pytest.mark.parametrize("vat_percent", [float("nan"), float("inf"), 1e300])
+def test_batch_out_of_range_price_raises(vat_percent):
+    with pytest.raises(OverflowError):
+        calculate_retail_book_price_batch(
+            QUANTITIES, "iPhone 15", np.array([20.0, vat_percent]).reshape(2, 1), 0.0, "128 Gb"
+        )
+
+
+def test_kernel_matches_interpreter():
+    # Whichever backend kernel.py picked must round exactly like pricing.py
+    reference = _load_pricing_source().price
+
+    for format_factor in FORMAT_COEF.values():
+        for pages_factor in MEM_COEF.values():
+            for vat_percent in VAT_PERCENTS:
+                for discount_percent in DISCOUNT_PERCENTS:
+                    for materials_discount in (1.0, 0.9, 0.85, 0.8):
+                        args = (
+                            format_factor,
+                            pages_factor,
+                            vat_percent,
+                            discount_percent,
+                            materials_discount
+                        )
+                        assert kernel.price(*args) == reference(*args)